@@ -898,12 +898,17 @@ class VREDEngine(sgtk.platform.Engine):
             )
         )
 
+        # Be sure the folder is created, such that VRED does not fail to save the file.
+        save_folder = os.path.dirname(sgutils.ensure_str(str(file_path)))
+        if save_folder:
+            os.makedirs(save_folder, exist_ok=True)
+
         self.vredpy.vrFileIO.save(file_path)
 
         if not os.path.exists(sgutils.ensure_str(str(file_path))):
             msg = "VRED Failed to save file {}".format(file_path)
             self.logger.error(msg)
-            raise Exception(msg)
+            raise sgtk.TankError(msg)
 
         if set_render_path:
             self.set_render_path(file_path)
@@ -9,6 +9,7 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 
 from functools import wraps
+from operator import methodcaller
 import sgtk
 
 HookBaseClass = sgtk.get_hook_baseclass()
@@ -378,7 +379,7 @@ class VREDDataValidationHook(HookBaseClass):
                 "description": "Optimizes the geometry structure and tries to share duplicated geometries.",
                 "fix_func": self._share_geometries,
                 "fix_name": "Optimize",
-                "get_kwargs": lambda: {"check_world_geometries": False},
+                "get_kwargs": lambda: {"check_world_matrix": False},
             },
             "optimize_merge_geometries": {
                 "name": "Merge/Optimmize/Share Geometries",
@@ -665,7 +666,12 @@ class VREDDataValidationHook(HookBaseClass):
 
     @check_vred_version_support
     def _find_hidden_nodes(
-        self, node=None, ignore_node_types=None, ignore_nodes=None, api_version=None
+        self,
+        node=None,
+        ignore_node_types=None,
+        ignore_nodes=None,
+        api_version=None,
+        max_depth=None,
     ):
         """
         Find all hidden nodes in the scene graph.
@@ -684,18 +690,25 @@ class VREDDataValidationHook(HookBaseClass):
         :type ignore_nodes: list<str>
         :param api_version: The VRED API version to use for finding hidden nodes. Defaults to v1.
         :type api_version: str (v1|v2)
+        :param max_depth: The maximum depth, relative to the node, of the nodes to check. If
+            None (default), there is no limit and the whole subtree is checked.
+        :type max_depth: int
 
         :return: The hidden nodes.
         :rtype: dict
         """
 
         api_version = api_version or self.vredpy.v1()
-        ignore_node_types = ignore_node_types or []
         hidden_nodes = self.vredpy.get_hidden_nodes(
-            root_node=node, ignore_node_types=ignore_node_types, api_version=api_version
+            root_node=node,
+            ignore_node_types=ignore_node_types,
+            api_version=api_version,
+            max_depth=max_depth,
         )
 
         if ignore_nodes:
+            # Convert to a set once, for constant time look ups per node
+            ignore_nodes = set(ignore_nodes)
             return [node for node in hidden_nodes if node.getName() not in ignore_nodes]
 
         return hidden_nodes
@@ -708,6 +721,7 @@ class VREDDataValidationHook(HookBaseClass):
         ignore_node_types=None,
         ignore_nodes=None,
         api_version=None,
+        max_depth=None,
     ):
         """
         Show the given hidden nodes, or show all hidden nodes if nodes not specified.
@@ -733,11 +747,14 @@ class VREDDataValidationHook(HookBaseClass):
         :param api_version: The VRED API version to use for finding hidden nodes. Defaults to
             v1. If errors specified, this param itself is ignored.
         :type api_version: str (v1|v2)
+        :param max_depth: The maximum depth, relative to the node, of the nodes to check. If
+            None (default), there is no limit. If errors specified, this param is ignored.
+        :type max_depth: int
         """
 
         if errors is None:
             hidden_nodes = self._find_hidden_nodes(
-                node, ignore_node_types, ignore_nodes, api_version
+                node, ignore_node_types, ignore_nodes, api_version, max_depth
             )
         else:
             hidden_nodes = self.vredpy.get_nodes(errors)
@@ -752,6 +769,7 @@ class VREDDataValidationHook(HookBaseClass):
         ignore_node_types=None,
         ignore_nodes=None,
         api_version=None,
+        max_depth=None,
     ):
         """
         Delete the given hidden nodes, or delete all hidden nodes if nodes not specified.
@@ -777,11 +795,14 @@ class VREDDataValidationHook(HookBaseClass):
         :param api_version: The VRED API version to use for finding hidden nodes. Defaults to
             v1. If errors specified, this param itself is ignored.
         :type api_version: str (v1|v2)
+        :param max_depth: The maximum depth, relative to the node, of the nodes to check. If
+            None (default), there is no limit. If errors specified, this param is ignored.
+        :type max_depth: int
         """
 
         if errors is None:
             hidden_nodes = self._find_hidden_nodes(
-                node, ignore_node_types, ignore_nodes, api_version
+                node, ignore_node_types, ignore_nodes, api_version, max_depth
             )
         else:
             hidden_nodes = self.vredpy.get_nodes(errors)
@@ -796,6 +817,7 @@ class VREDDataValidationHook(HookBaseClass):
         ignore_node_types=None,
         ignore_nodes=None,
         api_version=None,
+        max_depth=None,
     ):
         """
         Set all given nodes to B-Side, or set all hidden nodes if nodes not sepcified.
@@ -821,11 +843,14 @@ class VREDDataValidationHook(HookBaseClass):
         :param api_version: The VRED API version to use for finding hidden nodes. Defaults to
             v1. If errors specified, this param itself is ignored.
         :type api_version: str (v1|v2)
+        :param max_depth: The maximum depth, relative to the node, of the nodes to check. If
+            None (default), there is no limit. If errors specified, this param is ignored.
+        :type max_depth: int
         """
 
         if errors is None:
             hidden_nodes = self._find_hidden_nodes(
-                node, ignore_node_types, ignore_nodes, api_version
+                node, ignore_node_types, ignore_nodes, api_version, max_depth
             )
         else:
             hidden_nodes = self.vredpy.get_nodes(errors)
@@ -935,11 +960,14 @@ class VREDDataValidationHook(HookBaseClass):
         if not isinstance(vsets, (list, tuple)):
             vsets = [vsets]
 
-        for vset in vsets:
-            self.vredpy.vrVariantSets.deleteVariantSet(vset)
+        # Group the deletes into a single undo command, instead of one per variant set
+        delete_variant_set = self.vredpy.vrVariantSets.deleteVariantSet
+        with self.vredpy.undo_multi_command("Delete Variant Sets"):
+            for vset in vsets:
+                delete_variant_set(vset)
 
     @check_vred_version_support
-    def _find_animation_clips(self, top_level_only=False):
+    def _find_animation_clips(self, top_level_only=False, max_depth=None):
         """
         Find all animation clips.
 
@@ -948,12 +976,18 @@ class VREDDataValidationHook(HookBaseClass):
         :param top_level_only: True will only find the top level animation clips, else False
             will find all animation clips (including nested/child clips).
         :type top_level_only: bool
+        :param max_depth: The maximum depth, relative to the top level animation clips, of the
+            nested clips to find. If None (default), there is no limit. This param is ignored
+            if top_level_only is True.
+        :type max_depth: int
 
         :return: The animation clips.
         :rtype: dict
         """
 
-        return self.vredpy.get_animation_clips(top_level_only=top_level_only)
+        return self.vredpy.get_animation_clips(
+            top_level_only=top_level_only, max_depth=max_depth
+        )
 
     @check_vred_version_support
     def _delete_animation_clips(self, errors=None, top_level_only=False):
@@ -967,12 +1001,15 @@ class VREDDataValidationHook(HookBaseClass):
         :type errors: list
         :param top_level_only: True will only find the top level animation clips, else False
             will find all animation clips (including nested/child clips). This param is
-            ignored if the errors param is specified.
+            ignored if the errors param is specified. Deleting the top level clips also
+            deletes their nested clips, so the result is the same for both values.
         :type top_level_only: bool
         """
 
         if errors is None:
-            clip_nodes = self.vredpy.get_animation_clips(top_level_only=top_level_only)
+            # All nested clips are deleted along with their top level clip, there is no need to
+            # search for (and delete) the nested clips separately.
+            clip_nodes = self.vredpy.get_animation_clips(top_level_only=True)
         else:
             clip_nodes = self.vredpy.get_nodes(errors)
 
@@ -1025,11 +1062,14 @@ class VREDDataValidationHook(HookBaseClass):
         :rtype: dict
         """
 
-        return [
-            block
-            for block in self.vredpy.vrAnimWidgets.getAnimBlockNodes(include_hidden)
-            if block.getActive()
-        ]
+        # Filter with the builtin filter and methodcaller, to run the loop without executing
+        # Python bytecode per block.
+        return list(
+            filter(
+                methodcaller("getActive"),
+                self.vredpy.vrAnimWidgets.getAnimBlockNodes(include_hidden),
+            )
+        )
 
     @check_vred_version_support
     def _uncheck_animation_blocks(self, errors=None, include_hidden=True):
@@ -1047,33 +1087,41 @@ class VREDDataValidationHook(HookBaseClass):
         """
 
         if errors is None:
-            checked_blocks = [
-                block
-                for block in self.vredpy.vrAnimWidgets.getAnimBlockNodes(include_hidden)
-                if block.getActive()
-            ]
+            checked_blocks = self._find_checked_animation_blocks(
+                include_hidden=include_hidden
+            )
         else:
             checked_blocks = self.vredpy.get_nodes(errors)
 
-        for block in checked_blocks:
-            block.setActive(False)
+        with self.vredpy.undo_multi_command("Uncheck Animation Blocks"):
+            for block in checked_blocks:
+                block.setActive(False)
 
     @check_vred_version_support
-    def _find_geometries_without_material_uvs(self):
+    def _find_geometries_without_material_uvs(self, max_depth=None):
         """
         Find geometries without Material UV Sets.
 
         Format the data before returning to be compatible with the Data Validation App.
 
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to check. If None (default), there is no limit.
+        :type max_depth: int
+
         :return: The geometry without material UV sets.
         :rtype: dict
         """
 
-        return self.vredpy.get_geometry_nodes(has_mat_uvs=False)
+        return self.vredpy.get_geometry_nodes(has_mat_uvs=False, max_depth=max_depth)
 
     @check_vred_version_support
     def _create_material_uvs_for_geometries_without(
-        self, errors=None, nodes=None, unfold_settings=None, layout_settings=None
+        self,
+        errors=None,
+        nodes=None,
+        unfold_settings=None,
+        layout_settings=None,
+        max_depth=None,
     ):
         """
         Find geometries without Material UV Sets and create UVs for them.
@@ -1104,10 +1152,15 @@ class VREDDataValidationHook(HookBaseClass):
         :type unfold_settings: vrdUVUnfoldSettings
         :param layout_settings: The settings used to pack the unfolded UV islands into UV space.
         :type layout_settings: vrdUVLayoutSettings
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to unfold. This param is ignored if the errors param is specified.
+        :type max_depth: int
         """
 
         if errors is None:
-            nodes = self.vredpy.get_geometry_nodes(has_mat_uvs=False)
+            nodes = self.vredpy.get_geometry_nodes(
+                has_mat_uvs=False, max_depth=max_depth
+            )
         else:
             if nodes is None:
                 nodes = self.vredpy.get_nodes(errors, api_version=self.vredpy.v2())
@@ -1123,47 +1176,64 @@ class VREDDataValidationHook(HookBaseClass):
         )
 
     @check_vred_version_support
-    def _find_geometries_with_material_uvs(self):
+    def _find_geometries_with_material_uvs(self, max_depth=None):
         """
         Find geometries with Material UV Sets.
 
         Format the data before returning to be compatible with the Data Validation App.
 
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to check. If None (default), there is no limit.
+        :type max_depth: int
+
         :return: The geometry with material UV sets.
         :rtype: dict
         """
 
-        return self.vredpy.get_geometry_nodes(has_mat_uvs=True)
+        return self.vredpy.get_geometry_nodes(has_mat_uvs=True, max_depth=max_depth)
 
     @check_vred_version_support
-    def _find_geometries_without_light_uvs(self):
+    def _find_geometries_without_light_uvs(self, max_depth=None):
         """
         Find geometries without Light UV Sets.
 
         Format the data before returning to be compatible with the Data Validation App.
 
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to check. If None (default), there is no limit.
+        :type max_depth: int
+
         :return: The geometry without light UV sets.
         :rtype: dict
         """
 
-        return self.vredpy.get_geometry_nodes(has_light_uvs=False)
+        return self.vredpy.get_geometry_nodes(has_light_uvs=False, max_depth=max_depth)
 
     @check_vred_version_support
-    def _find_geometries_with_light_uvs(self):
+    def _find_geometries_with_light_uvs(self, max_depth=None):
         """
         Find geometries with Light UV Sets.
 
         Format the data before returning to be compatible with the Data Validation App.
 
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to check. If None (default), there is no limit.
+        :type max_depth: int
+
         :return: The geometry with light UV sets.
         :rtype: dict
         """
 
-        return self.vredpy.get_geometry_nodes(has_light_uvs=True)
+        return self.vredpy.get_geometry_nodes(has_light_uvs=True, max_depth=max_depth)
 
     @check_vred_version_support
     def _create_light_uvs_for_geometries_without(
-        self, errors=None, nodes=None, unfold_settings=None, layout_settings=None
+        self,
+        errors=None,
+        nodes=None,
+        unfold_settings=None,
+        layout_settings=None,
+        max_depth=None,
     ):
         """
         Find geometries without Light UV Sets and create UVs for them.
@@ -1194,10 +1264,15 @@ class VREDDataValidationHook(HookBaseClass):
         :type unfold_settings: vrdUVUnfoldSettings
         :param layout_settings: The settings used to pack the unfolded UV islands into UV space.
         :type layout_settings: vrdUVLayoutSettings
+        :param max_depth: The maximum depth, relative to the scene graph root node, of the
+            nodes to unfold. This param is ignored if the errors param is specified.
+        :type max_depth: int
         """
 
         if errors is None:
-            nodes = self.vredpy.get_geometry_nodes(has_light_uvs=False)
+            nodes = self.vredpy.get_geometry_nodes(
+                has_light_uvs=False, max_depth=max_depth
+            )
         else:
             if nodes is None:
                 nodes = self.vredpy.get_nodes(errors, api_version=self.vredpy.v2())
@@ -1243,14 +1318,14 @@ class VREDDataValidationHook(HookBaseClass):
         else:
             mats = self.vredpy.get_materials(errors)
 
-        for mat in mats:
-            try:
-                clearcoat = mat.getClearcoat()
-            except AttributeError:
-                clearcoat = None
+        with self.vredpy.undo_multi_command("Use Orange Peel"):
+            for mat in mats:
+                # Not all materials have the clearcoat property
+                get_clearcoat = getattr(mat, "getClearcoat", None)
+                clearcoat = get_clearcoat() if get_clearcoat is not None else None
 
-            if clearcoat:
-                clearcoat.setUseOrangePeel(True)
+                if clearcoat:
+                    clearcoat.setUseOrangePeel(True)
 
     @check_vred_version_support
     def _find_materials_not_using_texture(self):
@@ -1283,14 +1358,16 @@ class VREDDataValidationHook(HookBaseClass):
         else:
             mats = self.vredpy.get_materials(errors)
 
-        for mat in mats:
-            try:
-                bump_texture = mat.getBumpTexture()
-            except AttributeError:
-                bump_texture = None
+        with self.vredpy.undo_multi_command("Use Bump or Normal Maps"):
+            for mat in mats:
+                # Not all materials have the bump texture property
+                get_bump_texture = getattr(mat, "getBumpTexture", None)
+                bump_texture = (
+                    get_bump_texture() if get_bump_texture is not None else None
+                )
 
-            if bump_texture:
-                bump_texture.setUseTexture(True)
+                if bump_texture:
+                    bump_texture.setUseTexture(True)
 
     @check_vred_version_support
     def _group_animation_blocks(self):
@@ -1322,8 +1399,9 @@ class VREDDataValidationHook(HookBaseClass):
 
         :param errors: The geometry to bake. If None, bake the geometry in the node's subtree.
         :type errors: list
-        :param nodes: Ignored if errors param is not None. The geometry nodes to bake.
-        :type root_node: list<vrdGeometryNode>. If errors and nodes are None, then bake all nodes.
+        :param nodes: Ignored if errors param is not None. The geometry nodes to bake. If
+            errors and nodes are None, then bake all geometry nodes in the scene.
+        :type nodes: list<vrdGeometryNode>
         :param illumination_bake_settings: The illumination bake settings.
         :type illumination_bake_settings: vrdIlluminationBakeSettings
         :param texture_bake_settings: The texture bake settings.
@@ -1337,12 +1415,11 @@ class VREDDataValidationHook(HookBaseClass):
         :type replace_texture_bake: bool
         """
 
-        if errors is None:
+        if errors is not None:
             nodes = self.vredpy.get_nodes(errors, api_version=self.vredpy.v2())
-        else:
-            if nodes is None:
-                root = self.vredpy.vrNodeService.getRootNode()
-                nodes = self.vredpy.get_geometry_nodes(root_node=root)
+        elif nodes is None:
+            root = self.vredpy.vrNodeService.getRootNode()
+            nodes = self.vredpy.get_geometry_nodes(root_node=root)
 
         illumination_bake_settings = (
             illumination_bake_settings or self.vredpy.get_illumination_bake_settings()
@@ -1432,8 +1509,11 @@ class VREDDataValidationHook(HookBaseClass):
         if not isinstance(empty_groups, (list, tuple)):
             empty_groups = [empty_groups]
 
-        for group_name in empty_groups:
-            self.vredpy.vrVariantSets.deleteVariantSetGroup(group_name)
+        # Group the deletes into a single undo command, instead of one per group
+        delete_variant_set_group = self.vredpy.vrVariantSets.deleteVariantSetGroup
+        with self.vredpy.undo_multi_command("Delete Variant Set Groups"):
+            for group_name in empty_groups:
+                delete_variant_set_group(group_name)
 
     # -------------------------------------------------------------------------------------------------------
     # Optimize methods
@@ -1460,7 +1540,8 @@ class VREDDataValidationHook(HookBaseClass):
         :type stitches: bool
         """
 
-        root_node = root_node or self.vredpy.vrNodeService.getRootNode()
+        if root_node is None:
+            root_node = self.vredpy.vrNodeService.getRootNode()
         self.vredpy.vrOptimize.optimizeGeometry(root_node, strips, fans, stitches)
 
     def _share_geometries(self, root_node=None, check_world_matrix=False):
@@ -1475,7 +1556,8 @@ class VREDDataValidationHook(HookBaseClass):
         :type check_world_matrix: bool
         """
 
-        root_node = root_node or self.vredpy.vrNodeService.getRootNode()
+        if root_node is None:
+            root_node = self.vredpy.vrNodeService.getRootNode()
         self.vredpy.vrOptimize.shareGeometries(root_node, check_world_matrix)
 
     def _merge_geometries(self, root_node=None):
@@ -1487,7 +1569,8 @@ class VREDDataValidationHook(HookBaseClass):
         :type root_node: vrNodePtr
         """
 
-        root_node = root_node or self.vredpy.vrNodeService.getRootNode()
+        if root_node is None:
+            root_node = self.vredpy.vrNodeService.getRootNode()
         self.vredpy.vrOptimize.mergeGeometry(root_node)
 
     def _tessellate(
@@ -1503,7 +1586,8 @@ class VREDDataValidationHook(HookBaseClass):
         """
         Retessellate the geometry surfaces.
 
-        :param nodes: The nodes to tessellate. If None, the root node is used.
+        :param nodes: The nodes to tessellate. If None, the root node is used. If empty,
+            nothing is tessellated.
         :type nodes: List[vrNodePtr]
         :param chordal_deviaition: The chordal deviation limit.
         :type chordal_deviaition: float
@@ -1520,7 +1604,11 @@ class VREDDataValidationHook(HookBaseClass):
         :type preserve_uvs: bool
         """
 
-        nodes = nodes or [self.vredpy.vrNodeService.getRootNode()]
+        if nodes is None:
+            nodes = [self.vredpy.vrNodeService.getRootNode()]
+        elif not nodes:
+            # Nothing to do
+            return
 
         self.vredpy.vrGeometryEditor.tessellateSurfaces(
             nodes,
@@ -1536,7 +1624,8 @@ class VREDDataValidationHook(HookBaseClass):
         """
         Decores the given objects with the given settings.
 
-        :param nodes: The nodes to decore. Defaults to the root node.
+        :param nodes: The nodes to decore. Defaults to the root node. If empty, nothing is
+            decored.
         :type nodes: List[vrdNode]
         :param treat_as_combine_object: Defines if the given nodes are treated as combined objects or separately.
         :type treat_as_combine_object: bool
@@ -1544,8 +1633,14 @@ class VREDDataValidationHook(HookBaseClass):
         :type settings: vrdDecoreSettings
         """
 
-        nodes = nodes or [self.vredpy.vrNodeService.getRootNode()]
-        settings = settings or self.vredpy.get_decore_settings()
+        if nodes is None:
+            nodes = [self.vredpy.vrNodeService.getRootNode()]
+        elif not nodes:
+            # Nothing to do
+            return
+
+        if settings is None:
+            settings = self.vredpy.get_decore_settings()
 
         self.vredpy.vrDecoreService.decore(nodes, treat_as_combine_object, settings)
 
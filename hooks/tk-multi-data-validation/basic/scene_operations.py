@@ -9,7 +9,10 @@
 # not expressly granted therein are reserved by Autodesk Inc.
 
 
+from functools import partial
+
 import sgtk
+from sgtk.platform.qt import QtCore
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
@@ -17,10 +20,29 @@ HookBaseClass = sgtk.get_hook_baseclass()
 class VREDSceneOperationsHook(HookBaseClass):
     """Hook class that sets up VRED events to update the Data Validation App."""
 
+    # The VRED service signals that indicate the scene has changed, and the text to
+    # display for the change.
+    _SCENE_CHANGE_SIGNALS = (
+        ("vrNodeService", "nodesAdded", "Nodes added"),
+        ("vrNodeService", "nodesRemoved", "Nodes removed"),
+        ("vrMaterialService", "materialsChanged", "Materials changed"),
+        ("vrReferenceService", "referencesChanged", "References changed"),
+    )
+
     def __init__(self, *args, **kwargs):
         super(VREDSceneOperationsHook, self).__init__(*args, **kwargs)
         self.__scene_event_callbacks = []
 
+        # Scene change events are batched, such that a burst of events (e.g. from a bulk
+        # operation) only calls the change callback once. See `__queue_scene_change`.
+        self.__change_callback = None
+        self.__pending_change_text = None
+        self.__change_pending = False
+
+        # Map VRED scene graph change flags to their display text, resolved once on
+        # registering the scene events.
+        self.__change_text = {}
+
     def register_scene_events(self, reset_callback, change_callback):
         """
         Register events for when the scene has changed.
@@ -40,110 +62,142 @@ class VREDSceneOperationsHook(HookBaseClass):
             return
 
         vredpy = self.parent.engine.vredpy
+        self.__change_callback = change_callback
 
-        # Register VRED scene events. Wrap in try-except to avoid failing if the event is not
-        # supported by the current VRED version.
         try:
-            self.__scene_event_callbacks.append(
-                (vredpy.vrFileIOService.newScene, reset_callback)
+            change_flag = vredpy.vrScenegraphTypes.ChangeFlag
+            self.__change_text = {
+                change_flag.GraphChanged: "Graph changed",
+                change_flag.MetadataChanged: "Metadata changed",
+                change_flag.NodeChanged: "Node changed",
+            }
+        except AttributeError:
+            self.__change_text = {}
+
+        # Register VRED scene events. Skip any event that is not supported by the current
+        # VRED version.
+        signal_callbacks = [
+            (
+                "vrFileIOService",
+                "newScene",
+                partial(self.__handle_new_scene_event, reset_callback),
+            ),
+            (
+                "vrScenegraphService",
+                "scenegraphChanged",
+                self.__handle_scene_graph_changed_event,
+            ),
+        ]
+        signal_callbacks.extend(
+            (
+                service_name,
+                signal_name,
+                partial(self.__handle_scene_changed_event, text),
             )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
-
-        try:
-            self.__scene_event_callbacks.append(
-                (
-                    vredpy.vrScenegraphService.scenegraphChanged,
-                    lambda change_type: self.__handle_scene_graph_changed_event(
-                        change_type, change_callback
-                    ),
+            for service_name, signal_name, text in self._SCENE_CHANGE_SIGNALS
+        )
+
+        for service_name, signal_name, callback in signal_callbacks:
+            service = getattr(vredpy, service_name, None)
+            vred_signal = getattr(service, signal_name, None)
+            if vred_signal is None:
+                self.parent.logger.warning(
+                    f"Data Validation failed to register scene event: {service_name}.{signal_name}"
                 )
-            )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
+                continue
 
-        try:
-            self.__scene_event_callbacks.append(
-                (
-                    vredpy.vrNodeService.nodesAdded,
-                    lambda nodes: change_callback(text="Nodes added"),
+            try:
+                vred_signal.connect(callback)
+            except Exception as e:
+                self.parent.logger.warning(
+                    f"Data Validation failed to connect scene event: {service_name}.{signal_name}: {e}"
                 )
-            )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
+                continue
 
-        try:
-            self.__scene_event_callbacks.append(
-                (
-                    vredpy.vrNodeService.nodesRemoved,
-                    lambda nodes: change_callback(text="Nodes removed"),
-                )
-            )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
+            # Only keep the signals that were connected, to disconnect on unregister.
+            self.__scene_event_callbacks.append((vred_signal, callback))
 
-        try:
-            self.__scene_event_callbacks.append(
-                (
-                    vredpy.vrMaterialService.materialsChanged,
-                    lambda: change_callback(text="Materials changed"),
-                )
-            )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
+    def unregister_scene_events(self):
+        """Unregister the scene events."""
 
-        try:
-            self.__scene_event_callbacks.append(
-                (
-                    vredpy.vrReferenceService.referencesChanged,
-                    lambda nodes: change_callback(text="References changed"),
+        # Disconnect each signal independently, such that one failure does not leave the
+        # remaining signals connected.
+        for vred_signal, callback in self.__scene_event_callbacks:
+            try:
+                vred_signal.disconnect(callback)
+            except Exception as e:
+                self.parent.logger.debug(
+                    f"Data Validation failed to disconnect scene event: {e}"
                 )
-            )
-        except AttributeError as e:
-            self.parent.logger.warning(
-                f"Data Validation failed to register scene event: {e}"
-            )
 
-        for vred_signal, callback in self.__scene_event_callbacks:
-            vred_signal.connect(callback)
+        self.__scene_event_callbacks.clear()
+        self.__change_callback = None
 
-    def unregister_scene_events(self):
-        """Unregister the scene events."""
+    def __queue_scene_change(self, text=None):
+        """
+        Queue a call to the scene change callback.
 
-        for vred_signal, callback in self.__scene_event_callbacks:
-            vred_signal.disconnect(callback)
+        The callback is called once the event loop is processed, with the text of the latest
+        change queued that has a text. This collapses many scene change events, emitted by
+        VRED during a single operation, into one call to the callback.
 
-        self.__scene_event_callbacks = []
+        :param text: The text describing the scene change.
+        :type text: str
+        """
+
+        if text is not None or not self.__change_pending:
+            self.__pending_change_text = text
+
+        if self.__change_pending:
+            return
+
+        self.__change_pending = True
+        QtCore.QTimer.singleShot(0, self.__flush_scene_change)
+
+    def __flush_scene_change(self):
+        """Call the scene change callback with the latest queued change."""
+
+        if not self.__change_pending:
+            # The queued change was discarded by a new scene
+            return
+
+        self.__change_pending = False
+        if self.__change_callback:
+            self.__change_callback(text=self.__pending_change_text)
+
+    def __handle_new_scene_event(self, reset_callback, *args):
+        """
+        Intermediate callback handler for the VRED new scene event.
 
-    def __handle_scene_graph_changed_event(self, change_type, scene_change_callback):
+        Discard any queued scene change before resetting, such that changes emitted while the
+        scene was replaced do not show a stale warning after the reset.
+
+        :param reset_callback: Callback function to reset the Data Validation App.
+        :type reset_callback: callable
+        :param args: The arguments emitted by the VRED signal, these are passed through.
+        """
+
+        self.__change_pending = False
+        self.__pending_change_text = None
+        reset_callback(*args)
+
+    def __handle_scene_changed_event(self, text, *args):
+        """
+        Intermediate callback handler for the VRED scene changed events.
+
+        :param text: The text describing the scene change.
+        :type text: str
+        :param args: The arguments emitted by the VRED signal, these are ignored.
+        """
+
+        self.__queue_scene_change(text=text)
+
+    def __handle_scene_graph_changed_event(self, change_type):
         """
         Intermediate callback handler the VRED scene graph changed event.
 
         :param change_type: The VRED scene graph change type.
         :type change_type: vrScenegraphTypes.ChangeFlag
-        :param scene_change_callback: The callback to execute.
-        :type scene_change_callback: function
         """
 
-        vredpy = self.parent.engine.vredpy
-
-        if change_type == vredpy.vrScenegraphTypes.ChangeFlag.GraphChanged:
-            warning_text = "Graph changed"
-        elif change_type == vredpy.vrScenegraphTypes.ChangeFlag.MetadataChanged:
-            warning_text = "Metadata changed"
-        elif change_type == vredpy.vrScenegraphTypes.ChangeFlag.NodeChanged:
-            warning_text = "Node changed"
-        else:
-            warning_text = None
-
-        scene_change_callback(text=warning_text)
+        self.__queue_scene_change(text=self.__change_text.get(change_type))
@@ -8,7 +8,11 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
+import logging
 import os
+from collections import defaultdict
+from pathlib import PurePath
+
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
@@ -19,6 +23,43 @@ HookBaseClass = sgtk.get_hook_baseclass()
 class VredActions(HookBaseClass):
     """Hook that loads defines all the available actions, broken down by publish type."""
 
+    # Map the action names to the name of the method that executes the action. Each
+    # method is called with the path of the publish.
+    _ACTION_METHODS = {
+        "smart_reference": "create_smart_reference",
+        "import": "import_file",
+        "import_with_options": "open_import_dialog",
+        "import_sceneplate": "import_sceneplate",
+    }
+
+    # The action instances returned by generate_actions, for each of the actions supported.
+    _ACTION_INSTANCES = {
+        "smart_reference": {
+            "name": "smart_reference",
+            "params": None,
+            "caption": "Create Smart Reference",
+            "description": "This will import the item to the universe as a smart reference.",
+        },
+        "import": {
+            "name": "import",
+            "params": None,
+            "caption": "Import into Scene",
+            "description": "This will import the item into the current VRED Scene.",
+        },
+        "import_with_options": {
+            "name": "import_with_options",
+            "params": None,
+            "caption": "Open Import Dialog to change options...",
+            "description": "This will open the Import Options Dialog.",
+        },
+        "import_sceneplate": {
+            "name": "import_sceneplate",
+            "params": None,
+            "caption": "Import image(s) into scene as a sceneplate",
+            "description": "This will import the image(s) into the current VRED Scene.",
+        },
+    }
+
     def __init__(self, *args, **kwargs):
         """Initialize the hook."""
 
@@ -26,6 +67,12 @@ class VredActions(HookBaseClass):
 
         self.vredpy = self.parent.engine.vredpy
 
+        # The VRED version does not change, check once if it supports the import options dialog.
+        self._supports_import_with_options = (
+            self.parent.engine._version_check(self.parent.engine.vred_version, "2022.1")
+            >= 0
+        )
+
     ##############################################################################################################
     # public interface - to be overridden by deriving classes
 
@@ -67,74 +114,39 @@ class VredActions(HookBaseClass):
         :returns List of dictionaries, each with keys name, params, caption and description
         """
 
-        self.logger.debug(
-            "Generate actions called for UI element {ui}"
-            "Actions: {actions}"
-            "Publish Data: {data}".format(
-                ui=ui_area, actions=actions, data=sg_publish_data
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Generate actions called for UI element %s Actions: %s Publish Data: %s",
+                ui_area,
+                actions,
+                sg_publish_data,
             )
-        )
 
         action_instances = []
-        try:
-            # call base class first
-            action_instances += HookBaseClass.generate_actions(
+
+        # call base class first, if it has the method
+        base_generate_actions = getattr(HookBaseClass, "generate_actions", None)
+        if base_generate_actions is not None:
+            action_instances += base_generate_actions(
                 self, sg_publish_data, actions, ui_area
             )
-        except AttributeError:
-            # base class doesn't have the method, so ignore and continue
-            pass
-
-        if "smart_reference" in actions:
-            action_instances.append(
-                {
-                    "name": "smart_reference",
-                    "params": None,
-                    "caption": "Create Smart Reference",
-                    "description": "This will import the item to the universe as a smart reference.",
-                }
-            )
 
-        if "import" in actions:
-            action_instances.append(
-                {
-                    "name": "import",
-                    "params": None,
-                    "caption": "Import into Scene",
-                    "description": "This will import the item into the current VRED Scene.",
-                }
+        action_names = set(actions)
+        if (
+            "import_with_options" in action_names
+            and not self._supports_import_with_options
+        ):
+            self.logger.debug(
+                "Not able to add import_with_options to Loader actions. "
+                "This capability requires VRED 2022.1 or later."
             )
+            action_names.discard("import_with_options")
 
-        if "import_with_options" in actions:
-            if (
-                self.parent.engine._version_check(
-                    self.parent.engine.vred_version, "2022.1"
-                )
-                >= 0
-            ):
-                action_instances.append(
-                    {
-                        "name": "import_with_options",
-                        "params": None,
-                        "caption": "Open Import Dialog to change options...",
-                        "description": "This will open the Import Options Dialog.",
-                    }
-                )
-            else:
-                self.logger.debug(
-                    "Not able to add import_with_options to Loader actions. "
-                    "This capability requires VRED 2022.1 or later."
-                )
-
-        if "import_sceneplate" in actions:
-            action_instances.append(
-                {
-                    "name": "import_sceneplate",
-                    "params": None,
-                    "caption": "Import image(s) into scene as a sceneplate",
-                    "description": "This will import the image(s) into the current VRED Scene.",
-                }
-            )
+        action_instances.extend(
+            dict(action_instance)
+            for action_name, action_instance in self._ACTION_INSTANCES.items()
+            if action_name in action_names
+        )
 
         return action_instances
 
@@ -149,28 +161,20 @@ class VredActions(HookBaseClass):
         :returns: No return value expected.
         """
 
-        self.logger.debug(
-            "Execute action called for action {name}"
-            "Parameters: {params}"
-            "Publish Data: {data}".format(
-                name=name, params=params, data=sg_publish_data
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Execute action called for action %s Parameters: %s Publish Data: %s",
+                name,
+                params,
+                sg_publish_data,
             )
-        )
 
-        path = self.get_publish_path(sg_publish_data)
-
-        if name == "smart_reference":
-            self.create_smart_reference(path)
-
-        elif name == "import":
-            self.import_file(path)
+        action_method_name = self._ACTION_METHODS.get(name)
+        if action_method_name is None:
+            return
 
-        elif name == "import_with_options":
-            self.open_import_dialog(path)
-
-        elif name == "import_sceneplate":
-            image_path = self.get_publish_path(sg_publish_data)
-            self.import_sceneplate(image_path)
+        path = self.get_publish_path(sg_publish_data)
+        getattr(self, action_method_name)(path)
 
     def execute_multiple_actions(self, actions):
         """
@@ -198,35 +202,28 @@ class VredActions(HookBaseClass):
         :param list actions: Action dictionaries.
         """
 
-        batch_actions = {
-            "import": {
-                "paths": [],
-                "func": self.import_files,
-            },
-            "import_with_options": {
-                "paths": [],
-                "func": self.open_import_batch_dialog,
-            },
+        batch_action_funcs = {
+            "import": self.import_files,
+            "import_with_options": self.open_import_batch_dialog,
+            "import_sceneplate": self.import_sceneplates,
         }
 
+        # Group the actions that must be executed in a single batch function by name, and
+        # resolve their publish paths in one pass.
+        batch_action_paths = defaultdict(list)
         for action in actions:
             name = action["name"]
-            sg_publish_data = action["sg_publish_data"]
-            if name in batch_actions:
-                # This action must be executed in a single batch function
-                path = self.get_publish_path(sg_publish_data)
-                batch_actions[name]["paths"].append(path)
+            if name in batch_action_funcs:
+                batch_action_paths[name].append(
+                    self.get_publish_path(action["sg_publish_data"])
+                )
             else:
                 # This action can be executed in multiple single functions
-                params = action["params"]
-                self.execute_action(name, params, sg_publish_data)
+                self.execute_action(name, action["params"], action["sg_publish_data"])
 
-        # Execute batch functions now that the data has been gatheredt
-        for batch_action in batch_actions.values():
-            paths = batch_action["paths"]
-            if not paths:
-                continue  # No data, do not execute function
-            batch_action["func"](paths)
+        # Execute batch functions now that the data has been gathered
+        for name, paths in batch_action_paths.items():
+            batch_action_funcs[name](paths)
 
     def import_sceneplate(self, image_path):
         """
@@ -236,39 +233,81 @@ class VredActions(HookBaseClass):
         :param str image_path: Path to image file from the sg_published_data
         """
 
-        self.logger.debug(
-            "Import sceneplate for image file '{path}'".format(path=image_path)
-        )
+        self.import_sceneplates([image_path])
+
+    def import_sceneplates(self, image_paths):
+        """
+        Executes the import of the images and the creation of a VRED sceneplate for each
+        image.
+
+        :param image_paths: Paths to the image files from the sg_published_data
+        :type image_paths: List[str]
+        """
 
         QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
         try:
+            # Look up the VRED sceneplate API once for all images
+            sceneplate_service = self.vredpy.vrSceneplateService
+            sceneplate_types = self.vredpy.vrSceneplateTypes
+            frontplate_type = sceneplate_types.NodeType.Frontplate
+            image_content_type = sceneplate_types.ContentType.Image
+            sceneplate_node_class = self.vredpy.vrdSceneplateNode
+
             # Get the Sceneplate Root object
-            vredSceneplateRoot = self.vredpy.vrSceneplateService.getRootNode()
+            vredSceneplateRoot = sceneplate_service.getRootNode()
 
-            # Extract the filename for the name of the Sceneplate
-            nodeName = os.path.basename(image_path)
+            # The images loaded for this import, keyed by the image file path, such that the
+            # same image file imported into multiple sceneplates is only loaded once.
+            images = {}
 
-            # Load in the image
-            imageObject = self.vredpy.vrImageService.loadImage(image_path)
+            for image_path in image_paths:
+                self.logger.debug("Import sceneplate for image file '%s'", image_path)
 
-            # Create the actual Sceneplate node
-            newSceneplateNode = self.vredpy.vrSceneplateService.createNode(
-                vredSceneplateRoot,
-                self.vredpy.vrSceneplateTypes.NodeType.Frontplate,
-                nodeName,
-            )
-            newSceneplate = self.vredpy.vrdSceneplateNode(newSceneplateNode)
+                # Extract the filename for the name of the Sceneplate
+                nodeName = os.path.basename(image_path)
 
-            # Set the type to image
-            newSceneplate.setContentType(
-                self.vredpy.vrSceneplateTypes.ContentType.Image
-            )
+                # Load in the image
+                imageObject = self._load_sceneplate_image(image_path, images)
+
+                # Create the actual Sceneplate node
+                newSceneplateNode = sceneplate_service.createNode(
+                    vredSceneplateRoot, frontplate_type, nodeName
+                )
+                newSceneplate = sceneplate_node_class(newSceneplateNode)
+
+                # Set the type to image
+                newSceneplate.setContentType(image_content_type)
 
-            # Assign the image to the Sceneplate
-            newSceneplate.setImage(imageObject)
+                # Assign the image to the Sceneplate
+                newSceneplate.setImage(imageObject)
         finally:
             QtGui.QApplication.restoreOverrideCursor()
 
+    def _load_sceneplate_image(self, image_path, images):
+        """
+        Load the image for a sceneplate.
+
+        The image is only loaded if it is not already in the given images, such that
+        importing the same image file into multiple sceneplates only loads the image once.
+
+        :param image_path: Path to the image file.
+        :type image_path: str
+        :param images: The images already loaded, keyed by the normalized image file path.
+            The loaded image is added to this dict.
+        :type images: dict
+
+        :return: The loaded image.
+        :rtype: vrdImage
+        """
+
+        image_key = os.path.normcase(os.path.realpath(image_path))
+        image = images.get(image_key)
+        if image is None:
+            image = self.vredpy.vrImageService.loadImage(image_path)
+            images[image_key] = image
+
+        return image
+
     def create_smart_reference(self, path):
         """
         Create a smart reference for the given path
@@ -276,10 +315,10 @@ class VredActions(HookBaseClass):
         :param path: Path to the file to import as smart reference
         """
 
-        self.logger.debug("Creating smart reference for path {}".format(path))
+        self.logger.debug("Creating smart reference for path %s", path)
 
         # extract the node name from the reference path
-        ref_name = os.path.splitext(os.path.basename(path))[0]
+        ref_name = PurePath(path).stem
 
         # create the smart ref, load it and finally change the node name to reflect the ref path
         QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
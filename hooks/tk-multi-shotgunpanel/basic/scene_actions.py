@@ -8,7 +8,9 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import logging
 import os
+from pathlib import PurePath
 
 import sgtk
 from sgtk import util
@@ -23,6 +25,42 @@ HookBaseClass = sgtk.get_hook_baseclass()
 class VREDActions(HookBaseClass):
     """Hook that loads defines all the available actions, broken down by publish type."""
 
+    # Map the action names to the name of the method that executes the action. Each
+    # method is called with the path of the publish.
+    _ACTION_METHODS = {
+        "import": "import_file",
+        "import_sceneplate": "import_sceneplate",
+        "smart_reference": "create_smart_reference",
+    }
+
+    # The action instances returned by generate_actions, for each of the actions supported.
+    _ACTION_INSTANCES = {
+        "import": {
+            "name": "import",
+            "params": None,
+            "caption": "Import into Scene",
+            "description": "This will import the item into the current universe.",
+        },
+        "import_sceneplate": {
+            "name": "import_sceneplate",
+            "params": None,
+            "caption": "Import image(s) into scene as a sceneplate",
+            "description": "This will import the image(s) into the current VRED Scene.",
+        },
+        "load_for_review": {
+            "name": "load_for_review",
+            "params": None,
+            "caption": "Load for Review",
+            "description": "This will reset and load the item into the current universe.",
+        },
+        "smart_reference": {
+            "name": "smart_reference",
+            "params": None,
+            "caption": "Create Smart Reference",
+            "description": "This will import the item to the universe as a smart reference.",
+        },
+    }
+
     def __init__(self, *args, **kwargs):
         """Initialize the hook."""
 
@@ -68,61 +106,27 @@ class VREDActions(HookBaseClass):
         :returns List of dictionaries, each with keys name, params, caption and description
         """
 
-        self.logger.debug(
-            "Generate actions called for UI element {ui}"
-            "Actions: {actions}"
-            "Publish Data: {data}".format(ui=ui_area, actions=actions, data=sg_data)
-        )
-
-        action_instances = []
-        try:
-            # call base class first
-            action_instances += HookBaseClass.generate_actions(
-                self, sg_data, actions, ui_area
-            )
-        except AttributeError:
-            # base class doesn't have the method, so ignore and continue
-            pass
-
-        if "import" in actions:
-            action_instances.append(
-                {
-                    "name": "import",
-                    "params": None,
-                    "caption": "Import into Scene",
-                    "description": "This will import the item into the current universe.",
-                }
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Generate actions called for UI element %s Actions: %s Publish Data: %s",
+                ui_area,
+                actions,
+                sg_data,
             )
 
-        if "import_sceneplate" in actions:
-            action_instances.append(
-                {
-                    "name": "import_sceneplate",
-                    "params": None,
-                    "caption": "Import image(s) into scene as a sceneplate",
-                    "description": "This will import the image(s) into the current VRED Scene.",
-                }
-            )
+        action_instances = []
 
-        if "load_for_review" in actions:
-            action_instances.append(
-                {
-                    "name": "load_for_review",
-                    "params": None,
-                    "caption": "Load for Review",
-                    "description": "This will reset and load the item into the current universe.",
-                }
-            )
+        # call base class first, if it has the method
+        base_generate_actions = getattr(HookBaseClass, "generate_actions", None)
+        if base_generate_actions is not None:
+            action_instances += base_generate_actions(self, sg_data, actions, ui_area)
 
-        if "smart_reference" in actions:
-            action_instances.append(
-                {
-                    "name": "smart_reference",
-                    "params": None,
-                    "caption": "Create Smart Reference",
-                    "description": "This will import the item to the universe as a smart reference.",
-                }
-            )
+        action_names = set(actions)
+        action_instances.extend(
+            dict(action_instance)
+            for action_name, action_instance in self._ACTION_INSTANCES.items()
+            if action_name in action_names
+        )
 
         return action_instances
 
@@ -138,21 +142,20 @@ class VREDActions(HookBaseClass):
                   otherwise no return value expected.
         """
 
-        self.logger.debug(
-            "Execute action called for action {name}"
-            "Parameters: {params}"
-            "PTR Data: {data}".format(name=name, params=params, data=sg_data)
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Execute action called for action %s Parameters: %s PTR Data: %s",
+                name,
+                params,
+                sg_data,
+            )
 
         result = None
 
-        if name == "import":
+        action_method_name = self._ACTION_METHODS.get(name)
+        if action_method_name is not None:
             path = self.get_publish_path(sg_data)
-            self.vredpy.vrFileIO.loadGeometry(path)
-
-        elif name == "import_sceneplate":
-            image_path = self.get_publish_path(sg_data)
-            self.import_sceneplate(image_path)
+            getattr(self, action_method_name)(path)
 
         elif name == "load_for_review":
             if self._load_for_review(sg_data):
@@ -160,16 +163,11 @@ class VREDActions(HookBaseClass):
                 # represented by the PTR data.
                 result = sg_data
 
-        elif name == "smart_reference":
-            path = self.get_publish_path(sg_data)
-            self.create_smart_reference(path)
-
         else:
-            try:
-                result = HookBaseClass.execute_action(self, name, params, sg_data)
-            except AttributeError:
-                # base class doesn't have the method, so ignore and continue
-                pass
+            # call base class, if it has the method
+            base_execute_action = getattr(HookBaseClass, "execute_action", None)
+            if base_execute_action is not None:
+                result = base_execute_action(self, name, params, sg_data)
 
         return result
 
@@ -220,19 +218,29 @@ class VREDActions(HookBaseClass):
 
         return self._load_for_review(sg_data, confirm_action=True)
 
+    def import_file(self, path):
+        """
+        Import the file into VRED.
+
+        :param path: Path of file to import
+        :type path: str
+        """
+
+        self.vredpy.vrFileIO.loadGeometry(path)
+
     def create_smart_reference(self, path):
         """
         Create a smart reference for the given path
         :param path: Path to the file to import as smart reference
         """
 
-        self.logger.debug("Creating smart reference for path {}".format(path))
+        self.logger.debug("Creating smart reference for path %s", path)
 
         # extract the node name from the reference path
-        ref_name = os.path.splitext(os.path.basename(path))[0]
+        ref_name = PurePath(path).stem
 
         # create the smart ref, load it and finally change the node name to reflect the ref path
-        ref_node = self.vred_p.yvrReferenceService.createSmart()
+        ref_node = self.vredpy.vrReferenceService.createSmart()
         ref_node.setSmartPath(path)
         ref_node.load()
         ref_node.setName(ref_name)
@@ -245,9 +253,7 @@ class VREDActions(HookBaseClass):
         :param str image_path: Path to image file from the sg_published_data
         """
 
-        self.logger.debug(
-            "Import sceneplate for image file '{path}'".format(path=image_path)
-        )
+        self.logger.debug("Import sceneplate for image file '%s'", image_path)
 
         # Get the Sceneplate Root object
         vredSceneplateRoot = self.vredpy.vrSceneplateService.getRootNode()  # noqa
@@ -9,6 +9,7 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
+import subprocess
 
 from sgtk.platform.qt import QtCore, QtGui
 from sgtk.util import is_windows, is_linux, is_macos
@@ -281,21 +282,34 @@ class VREDMenuGenerator(object):
         paths = self._engine.context.filesystem_locations
 
         for disk_location in paths:
-            if is_linux():
-                cmd = 'xdg-open "{}"'.format(disk_location)
-            elif is_macos():
-                cmd = 'open "{}"'.format(disk_location)
-            elif is_windows():
-                cmd = 'cmd.exe /C start "Folder" "{}"'.format(disk_location)
-            else:
-                raise Exception("Platform is not supported.")
+            self._engine.logger.debug(
+                "Jump to filesystem location:  {}".format(disk_location)
+            )
 
-            self._engine.logger.debug("Jump to filesystem command:  {}".format(cmd))
+            # Launch the file browser directly, without going through a shell.
+            exit_code = 0
+            try:
+                if is_linux():
+                    exit_code = subprocess.call(["xdg-open", disk_location])
+                elif is_macos():
+                    exit_code = subprocess.call(["open", disk_location])
+                elif is_windows():
+                    os.startfile(disk_location)
+                else:
+                    raise Exception("Platform is not supported.")
+            except OSError as e:
+                self._engine.logger.error(
+                    "Failed to open filesystem location '{}': {}".format(
+                        disk_location, e
+                    )
+                )
+                continue
 
-            exit_code = os.system(cmd)
             if exit_code != 0:
                 self._engine.logger.error(
-                    "Failed to launch command:  '{}'!".format(cmd)
+                    "Failed to open filesystem location '{}': exit code {}".format(
+                        disk_location, exit_code
+                    )
                 )
 
 
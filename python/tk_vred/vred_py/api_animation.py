@@ -30,7 +30,7 @@ class VREDPyAnimation(VREDPyBase):
 
         return clip_node.getType() == self.vred_py.clip_type()
 
-    def get_animation_clips(self, top_level_only=True, anim_type=None):
+    def get_animation_clips(self, top_level_only=True, anim_type=None, max_depth=None):
         """
         Return all animation clip nodes.
 
@@ -41,6 +41,10 @@ class VREDPyAnimation(VREDPyBase):
         :type top_level_only: bool
         :param anim_type: The type of animation clip nodes to return.
         :type anim_type: str
+        :param max_depth: The maximum depth, relative to the top-level animation clip nodes,
+            of the nodes to check. If None (default), there is no limit and all nodes are
+            checked. This is ignored when only the top-level clips are returned.
+        :type max_depth: int
 
         :return: The animation clip nodes.
         :rtype: list<vrNodePtr>
@@ -57,16 +61,19 @@ class VREDPyAnimation(VREDPyBase):
 
         # Recurse to get all child nodes
         nodes = []
-        while top_level_nodes:
-            node = top_level_nodes.pop()
+        nodes_to_check = [(node, 0) for node in top_level_nodes]
+        while nodes_to_check:
+            node, depth = nodes_to_check.pop()
             node_type = node.getType()
-            num_children = node.getNChildren()
 
             if node_type == anim_type:
                 nodes.append(node)
 
-            for i in range(num_children):
-                top_level_nodes.append(node.getChild(i))
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for i in range(node.getNChildren()):
+                nodes_to_check.append((node.getChild(i), depth + 1))
 
         return nodes
 
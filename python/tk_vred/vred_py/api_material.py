@@ -89,24 +89,26 @@ class VREDPyMaterial(VREDPyBase):
         if using_orange_peel is None and using_texture is None:
             return mats
 
+        if using_orange_peel is not None:
+            # Look up the clearcoat type once, instead of for each material
+            clearcoat_type_off = self.vred_py.vrdClearcoat.Type.Off
+
         result = []
         for mat in mats:
             # Check clearcoat orange peel property, if specified.
             if using_orange_peel is not None:
-                try:
-                    clearcoat = mat.getClearcoat()
-                except AttributeError:
+                get_clearcoat = getattr(mat, "getClearcoat", None)
+                if get_clearcoat is None:
                     # This material does not have the clearcoat property. Do not accept it.
                     continue
 
+                clearcoat = get_clearcoat()
                 mat_supports_orange_peel = clearcoat.supportsOrangePeel()
                 if not mat_supports_orange_peel:
                     # This material does not support the clearcoat property. Do not accept it.
                     continue
 
-                clearcoat_off = (
-                    clearcoat.getType() == self.vred_py.vrdClearcoat.Type.Off
-                )
+                clearcoat_off = clearcoat.getType() == clearcoat_type_off
                 if clearcoat_off:
                     # This material has clearcoat turned off. Do not accept it.
                     continue
@@ -118,10 +120,10 @@ class VREDPyMaterial(VREDPyBase):
 
             # Check bump texture property, if specified.
             if using_texture is not None:
-                try:
-                    bump_texture = mat.getBumpTexture()
-                except AttributeError:
-                    bump_texture = None
+                get_bump_texture = getattr(mat, "getBumpTexture", None)
+                bump_texture = (
+                    get_bump_texture() if get_bump_texture is not None else None
+                )
 
                 if not bump_texture or using_texture != bump_texture.getUseTexture():
                     continue
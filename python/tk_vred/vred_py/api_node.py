@@ -91,29 +91,34 @@ class VREDPyNode(VREDPyBase):
         if not isinstance(items, (list, tuple)):
             items = [items]
 
+        # Look up the API version and node types once for all items
+        is_v1 = api_version == self.vred_py.v1()
+        node_ptr_type = self.vred_py.vrNodePtr.vrNodePtr
+        node_type = self.vred_py.vrdNode
+
         for item in items:
             if isinstance(item, dict):
                 item = item.get("id")
 
             node = None
-            if isinstance(item, self.vred_py.vrNodePtr.vrNodePtr):
-                if api_version == self.vred_py.v1():
+            if isinstance(item, node_ptr_type):
+                if is_v1:
                     node = item
                 else:
                     node = self.vred_py.vrNodeService.getNodeFromId(item.getID())
-            elif isinstance(item, self.vred_py.vrdNode):
-                if api_version == self.vred_py.v1():
-                    node = self.vred_py.vrNodePtr.toNode(item.getObjcetId())
+            elif isinstance(item, node_type):
+                if is_v1:
+                    node = self.vred_py.vrNodePtr.toNode(item.getObjectId())
                 else:
                     node = item
             elif isinstance(item, int):
-                if api_version == self.vred_py.v1():
+                if is_v1:
                     node = self.vred_py.vrNodePtr.toNode(item)
                 else:
                     node = self.vred_py.vrNodeService.getNodeFromId(item)
             else:
                 try:
-                    if api_version == self.vred_py.v1():
+                    if is_v1:
                         node = self.vred_py.vrScenegraph.findNode(item)
                     else:
                         node = self.vred_py.vrNodeService.findNode(item)
@@ -129,7 +134,9 @@ class VREDPyNode(VREDPyBase):
 
         return nodes
 
-    def get_geometry_nodes(self, root_node=None, has_mat_uvs=None, has_light_uvs=None):
+    def get_geometry_nodes(
+        self, root_node=None, has_mat_uvs=None, has_light_uvs=None, max_depth=None
+    ):
         """
         Return all geometry nodes in the subtree of the root_node.
 
@@ -139,18 +146,29 @@ class VREDPyNode(VREDPyBase):
         :param root_node: The subtree of this root node will be checked. If None, the scene
             graph root node will be used.
         :type root_node: vrdNode
+        :param max_depth: The maximum depth, relative to the root node, of the nodes to check.
+            If None (default), there is no limit and the whole subtree is checked.
+        :type max_depth: int
 
         :return: The list of geometry nodes.
         :rtype: list<vrdNode>
         """
 
-        def _get_geometry_nodes(node, result, has_mat_uvs=None, has_light_uvs=None):
+        # Look up the UV Set types once, instead of for each node
+        material_uv_set = self.vred_py.vrUVTypes.MaterialUVSet
+        light_uv_set = self.vred_py.vrUVTypes.LightmapUVSet
+
+        def _get_geometry_nodes(
+            node, result, has_mat_uvs=None, has_light_uvs=None, depth=0
+        ):
             """
             Recursive helper function to get geoemtry nodes.
 
             :param node: The current node.
             :type node: vrdNode
             :param has_mat_uvs: ...
+            :param depth: The depth of the current node, relative to the root node.
+            :type depth: int
             """
 
             if not node:
@@ -162,33 +180,32 @@ class VREDPyNode(VREDPyBase):
                 if has_mat_uvs is None and has_light_uvs is None:
                     # Add geometry regardless of material/light UVs
                     result.append(node)
-                elif has_mat_uvs is None and has_light_uvs is None:
-                    # Add geometry based on both material/light UVs
-                    if (
-                        node.hasUVSet(self.vred_py.vrUVTypes.MaterialUVSet)
-                        == has_mat_uvs
-                        and node.hasUVSet(self.vred_py.vrUVTypes.LightmapUVSet)
-                        == has_light_uvs
-                    ):
-                        result.append(node)
                 elif has_mat_uvs is None:
                     # Add only geometry based on light UVs, ignore material UVs
-                    if (
-                        node.hasUVSet(self.vred_py.vrUVTypes.LightmapUVSet)
-                        == has_light_uvs
-                    ):
+                    if node.hasUVSet(light_uv_set) == has_light_uvs:
                         result.append(node)
                 elif has_light_uvs is None:
                     # Add only geometry based on material UVs, ignore light UVs
+                    if node.hasUVSet(material_uv_set) == has_mat_uvs:
+                        result.append(node)
+                else:
+                    # Add geometry based on both material/light UVs
                     if (
-                        node.hasUVSet(self.vred_py.vrUVTypes.MaterialUVSet)
-                        == has_mat_uvs
+                        node.hasUVSet(material_uv_set) == has_mat_uvs
+                        and node.hasUVSet(light_uv_set) == has_light_uvs
                     ):
                         result.append(node)
 
+            if max_depth is not None and depth >= max_depth:
+                return
+
             for child in node.getChildren():
                 _get_geometry_nodes(
-                    child, result, has_mat_uvs=has_mat_uvs, has_light_uvs=has_light_uvs
+                    child,
+                    result,
+                    has_mat_uvs=has_mat_uvs,
+                    has_light_uvs=has_light_uvs,
+                    depth=depth + 1,
                 )
 
         root_node = root_node or self.get_root_node(api_version=self.vred_py.v2())
@@ -199,7 +216,7 @@ class VREDPyNode(VREDPyBase):
         return nodes
 
     def get_hidden_nodes(
-        self, root_node=None, ignore_node_types=None, api_version=None
+        self, root_node=None, ignore_node_types=None, api_version=None, max_depth=None
     ):
         """
         Return a list of the hidden nodes in the scene graph.
@@ -216,33 +233,39 @@ class VREDPyNode(VREDPyBase):
         :type ignore_node_types: list<str> (for v1) | list<class> (for v2)
         :param api_version: The VRED API version used to retrieve and return hidden node.
         :type api_version: str
+        :param max_depth: The maximum depth, relative to the root node, of the nodes to check.
+            If None (default), there is no limit and the whole subtree is checked.
+        :type max_depth: int
         """
 
         api_version = api_version or self.vred_py.v1()
         self.vred_py.check_api_version(api_version)
 
-        ignore_node_types = ignore_node_types or []
+        # Convert to a set once, for constant time look ups per node
+        ignore_node_types = frozenset(ignore_node_types or ())
 
         if root_node is None:
-            nodes = [self.get_root_node(api_version=api_version)]
-        else:
-            nodes = [root_node]
+            root_node = self.get_root_node(api_version=api_version)
+
+        node_ptr_type = self.vred_py.vrNodePtr.vrNodePtr
 
+        nodes = [(root_node, 0)]
         hidden = []
         while nodes:
-            node = nodes.pop()
+            node, depth = nodes.pop()
+            check_children = max_depth is None or depth < max_depth
 
-            if isinstance(node, self.vred_py.vrNodePtr.vrNodePtr):
+            if isinstance(node, node_ptr_type):
                 # v1
                 if node.getType() in ignore_node_types:
                     continue
 
                 if not node.getActive():
                     hidden.append(node)
-                else:
+                elif check_children:
                     # Only check children if the parent is not hidden
                     for i in range(node.getNChildren()):
-                        nodes.append(node.getChild(i))
+                        nodes.append((node.getChild(i), depth + 1))
             else:
                 # v2
                 if type(node) in ignore_node_types:
@@ -250,10 +273,10 @@ class VREDPyNode(VREDPyBase):
 
                 if not node.isVisible():
                     hidden.append(node)
-                else:
+                elif check_children:
                     # Only check children if the parent is not hidden
                     for child in node.getChildren():
-                        nodes.append(child)
+                        nodes.append((child, depth + 1))
 
         return hidden
 
@@ -297,14 +320,24 @@ class VREDPyNode(VREDPyBase):
         if not nodes:
             return
 
-        for node in nodes:
-            # Check if we're handling a v1 or v2 node object
-            if isinstance(node, self.vred_py.vrNodePtr.vrNodePtr):
-                self.vred_py.vrNodeUtils.setToBSide(node, b_side)
-            elif isinstance(node, self.vred_py.vrdGeometryNode):
-                node.setToBSide(b_side)
-            else:
-                raise self.vred_py.VREDPyError("Not a geometry node {}".format(node))
+        # VRED does not provide a function to set multiple nodes at once. Resolve the API
+        # attributes once, instead of for each node, and group the changes into a single
+        # undo command.
+        node_ptr_type = self.vred_py.vrNodePtr.vrNodePtr
+        geometry_node_type = self.vred_py.vrdGeometryNode
+        set_to_b_side_v1 = self.vred_py.vrNodeUtils.setToBSide
+
+        with self.vred_py.undo_multi_command("Set To B-Side"):
+            for node in nodes:
+                # Check if we're handling a v1 or v2 node object
+                if isinstance(node, node_ptr_type):
+                    set_to_b_side_v1(node, b_side)
+                elif isinstance(node, geometry_node_type):
+                    node.setToBSide(b_side)
+                else:
+                    raise self.vred_py.VREDPyError(
+                        "Not a geometry node {}".format(node)
+                    )
 
     def show_nodes(self, nodes):
         """
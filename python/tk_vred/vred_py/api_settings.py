@@ -158,18 +158,16 @@ class VREDPySetting(VREDPyBase):
         :type post_scale_mode: vrUVTypes.PostScaleMode
         """
 
-        pre_rotate_mode = (
-            pre_rotate_mode or self.vred_py.vrUVTypes.PreRotateMode.YAxisToV
-        )
-        pre_scale_mode = (
-            pre_scale_mode or self.vred_py.vrUVTypes.PreScaleMode.Keep3DArea
-        )
-        tile_assign_mode = (
-            tile_assign_mode or self.vred_py.vrUVTypes.TileAssignMode.Distribute
-        )
-        post_scale_mode = (
-            post_scale_mode or self.vred_py.vrUVTypes.PostScaleMode.Uniform
-        )
+        # Check for None to set the defaults, since an enum value passed in may be falsy
+        # (e.g. the first value of the enum).
+        if pre_rotate_mode is None:
+            pre_rotate_mode = self.vred_py.vrUVTypes.PreRotateMode.YAxisToV
+        if pre_scale_mode is None:
+            pre_scale_mode = self.vred_py.vrUVTypes.PreScaleMode.Keep3DArea
+        if tile_assign_mode is None:
+            tile_assign_mode = self.vred_py.vrUVTypes.TileAssignMode.Distribute
+        if post_scale_mode is None:
+            post_scale_mode = self.vred_py.vrUVTypes.PostScaleMode.Uniform
 
         settings = self.vred_py.vrdUVLayoutSettings()
 
@@ -259,7 +257,9 @@ class VREDPySetting(VREDPyBase):
         :type edge_dilation: int
         """
 
-        renderer = renderer or self.vred_py.vrBakeTypes.Renderer.CPURayTracing
+        # Check for None to set the default, since an enum value passed in may be falsy.
+        if renderer is None:
+            renderer = self.vred_py.vrBakeTypes.Renderer.CPURayTracing
 
         settings = self.vred_py.vrdTextureBakeSettings()
 
@@ -342,14 +342,16 @@ class VREDPySetting(VREDPyBase):
         :rtype: vrdIlluminationBakeSettings
         """
 
-        direct_illumination_mode = (
-            direct_illumination_mode
-            or self.vred_py.vrBakeTypes.DirectIlluminationMode.AmbientOcclusion
-        )
-        ambient_occlusion_weight = (
-            ambient_occlusion_weight
-            or self.vred_py.vrBakeTypes.AmbientOcclusionWeight.Uniform
-        )
+        # Check for None to set the defaults, since an enum value passed in may be falsy
+        # (e.g. the first value of the enum).
+        if direct_illumination_mode is None:
+            direct_illumination_mode = (
+                self.vred_py.vrBakeTypes.DirectIlluminationMode.AmbientOcclusion
+            )
+        if ambient_occlusion_weight is None:
+            ambient_occlusion_weight = (
+                self.vred_py.vrBakeTypes.AmbientOcclusionWeight.Uniform
+            )
 
         settings = self.vred_py.vrdIlluminationBakeSettings()
 
@@ -410,15 +412,16 @@ class VREDPySetting(VREDPyBase):
         :rtype: vrdDecoreSettings
         """
 
-        decore_mode = decore_mode or self.vred_py.vrGeometryTypes.DecoreMode.Remove
-        sub_object_mode = (
-            sub_object_mode
-            or self.vred_py.vrGeometryTypes.DecoreSubObjectMode.Triangles
-        )
-        transparent_object_mode = (
-            transparent_object_mode
-            or self.vred_py.vrGeometryTypes.DecoreTransparentObjectMode.Ignore
-        )
+        # Check for None to set the defaults, since an enum value passed in may be falsy
+        # (e.g. the first value of the enum).
+        if decore_mode is None:
+            decore_mode = self.vred_py.vrGeometryTypes.DecoreMode.Remove
+        if sub_object_mode is None:
+            sub_object_mode = self.vred_py.vrGeometryTypes.DecoreSubObjectMode.Triangles
+        if transparent_object_mode is None:
+            transparent_object_mode = (
+                self.vred_py.vrGeometryTypes.DecoreTransparentObjectMode.Ignore
+            )
 
         settings = self.vred_py.vrdDecoreSettings()
 
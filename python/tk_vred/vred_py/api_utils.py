@@ -8,6 +8,8 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk.
 
+from contextlib import contextmanager
+
 from .base import VREDPyBase
 from . import constants
 
@@ -53,6 +55,34 @@ class VREDPyUtils(VREDPyBase):
                 )
             )
 
+    # -------------------------------------------------------------------------------------------------------
+    # VRED API Undo
+    # -------------------------------------------------------------------------------------------------------
+
+    @contextmanager
+    def undo_multi_command(self, name):
+        """
+        Context manager to group all operations executed within into a single undo command.
+
+        Grouping the operations avoids pushing one undo entry per operation, which is costly
+        for bulk edits. If the current running VRED version does not support undo multi
+        commands, the operations are executed as is.
+
+        :param name: The display name of the undo command.
+        :type name: str
+        """
+
+        undo_service = getattr(self.vred_py, "vrUndoService", None)
+        if undo_service is None or not hasattr(undo_service, "beginMultiCommand"):
+            yield
+            return
+
+        undo_service.beginMultiCommand(name)
+        try:
+            yield
+        finally:
+            undo_service.endMultiCommand()
+
     # -------------------------------------------------------------------------------------------------------
     # VRED API Types
     # -------------------------------------------------------------------------------------------------------